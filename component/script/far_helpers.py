@@ -48,7 +48,25 @@
 #     return raw_vars
 
 
+import functools
 import re
+import sys
+from typing import Iterable
+
+try:  # optional: SIMD regex engine used by ``extract_variables_batch``
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+# Patterns used by ``extract_variables``; compiled once at import time.
+_IDENT_RE = re.compile(r"\b[A-Za-z_]\w*")
+# The body of an I() call is bounded so a malformed formula with many
+# unclosed "I(" cannot trigger a quadratic scan; longer bodies are rejected.
+_I_EXPR_MAX_LEN = 256
+_I_EXPR_RE = re.compile(r"I\(([^)]{0,%d})\)" % _I_EXPR_MAX_LEN)
+
+# Patsy transformation names that are never treated as variables.
+_KEYWORDS = frozenset({"i", "scale", "c", "poly", "bs", "cr"})
 
 
 def extract_variables(formula: str, mode: str = "predictors") -> set:
@@ -81,7 +99,86 @@ def extract_variables(formula: str, mode: str = "predictors") -> set:
     {'fcc'}
     >>> extract_variables(formula, mode='all')
     {'altitude', 'dist_edge', 'pa', 'fcc', 'trial'}
+
+    Notes
+    -----
+    In mode 'I', the body of each I() call is read up to its first closing
+    parenthesis and at most 256 characters; an unclosed or longer I() body
+    raises ``ValueError`` rather than being silently ignored. Nested
+    transforms such as I(log(x) + y) should be flattened (e.g. into a new
+    column) beforehand.
+
+    Results are memoized per (formula, mode) and the names are interned
+    with ``sys.intern``; each call returns a new set, so callers may modify
+    it freely. Use ``extract_variables.cache_clear()`` to reset the cache.
+    """
+    return set(_extract_variables_cached(formula, mode))
+
+
+def extract_variables_batch(formulas: Iterable[str], mode: str = "predictors") -> list:
+    """
+    Extract variable names from many Patsy-style formulas at once.
+
+    Equivalent to ``[extract_variables(f, mode) for f in formulas]``. When the
+    optional ``hyperscan`` package is installed, identifiers are found with a
+    single compiled Hyperscan database shared by all formulas, which is much
+    faster than ``re`` for large batches (e.g. covariate subset searches).
+
+    Parameters
+    ----------
+    formulas : Iterable[str]
+        Patsy formula strings.
+    mode : {'predictors', 'target', 'I', 'all'}
+        See ``extract_variables``.
+
+    Returns
+    -------
+    list of set
+        One set of raw variable names per formula, in input order.
     """
+    formulas = list(formulas)
+    if hyperscan is None:
+        return [extract_variables(formula, mode) for formula in formulas]
+
+    db = _hyperscan_ident_db()
+    parsed = {}
+    for formula in dict.fromkeys(formulas):
+        lhs, target_expr = _split_formula(formula, mode)
+        if not target_expr.isascii():  # Hyperscan offsets are byte offsets
+            parsed[formula] = _extract_variables_cached(formula, mode)
+            continue
+        spans = []
+        db.scan(
+            target_expr.encode("ascii"),
+            match_event_handler=_collect_span,
+            context=spans,
+        )
+        names = [target_expr[start:end] for start, end in spans]
+        parsed[formula] = _select_variables(names, lhs, mode)
+
+    return [set(parsed[formula]) for formula in formulas]
+
+
+@functools.lru_cache(maxsize=1)
+def _hyperscan_ident_db():
+    """Compile (once) the Hyperscan database matching whole identifiers."""
+    db = hyperscan.Database()
+    db.compile(
+        expressions=[rb"\b[A-Za-z_]\w*\b"],
+        ids=[0],
+        elements=1,
+        flags=[hyperscan.HS_FLAG_SOM_LEFTMOST],
+    )
+    return db
+
+
+def _collect_span(id_, start, end, flags, spans):
+    """Hyperscan match callback: record the (start, end) of an identifier."""
+    spans.append((start, end))
+
+
+def _split_formula(formula: str, mode: str) -> tuple:
+    """Return the LHS and the part of ``formula`` to parse for ``mode``."""
     # --- Split formula ---
     parts = formula.split("~", 1)
     lhs = parts[0].strip()
@@ -99,41 +196,53 @@ def extract_variables(formula: str, mode: str = "predictors") -> set:
     else:
         raise ValueError("mode must be one of: 'predictors', 'target', 'I', 'all'")
 
-    raw_vars = set()
-
-    # --- Match function-like patterns: scale(...), C(...), I(...), etc. ---
-    func_pattern = r"[a-zA-Z_][a-zA-Z0-9_]*\(([^)]*)\)"
-    matches = re.findall(func_pattern, target_expr)
-
-    for expr in matches:
-        tokens = re.split(r"[+\-*/\(\)\s]", expr)
-        tokens = [t.strip() for t in tokens if t.strip()]
-        for token in tokens:
-            if re.match(r"^\d+(\.\d+)?$", token):  # skip numbers
-                continue
-            if token.lower() in {"i", "scale", "c", "poly", "bs", "cr"}:
-                continue
-            raw_vars.add(token)
-
-    # --- Extract standalone variables ---
-    standalone = re.findall(r"\b[a-zA-Z_][a-zA-Z0-9_]*\b", target_expr)
-    for var in standalone:
-        if var.lower() in {"i", "scale", "c", "poly", "bs", "cr"}:
-            continue
-        raw_vars.add(var)
+    return lhs, target_expr
+
+
+def _find_I_expressions(lhs: str) -> list:
+    """Return the bodies of the I() calls in ``lhs``, in order."""
+    expressions = []
+    pos = lhs.find("I(")
+    while pos != -1:
+        match = _I_EXPR_RE.match(lhs, pos)
+        if match is None:
+            raise ValueError(
+                f"I() expression at position {pos} is unclosed or longer than "
+                f"{_I_EXPR_MAX_LEN} characters: {lhs!r}"
+            )
+        expressions.append(match.group(1))
+        pos = lhs.find("I(", match.end())
+    return expressions
+
+
+def _select_variables(names: Iterable[str], lhs: str, mode: str) -> frozenset:
+    """Drop Patsy keywords (and, in mode 'I', names outside I()) from ``names``."""
+    raw_vars = {name for name in names if name.lower() not in _KEYWORDS}
 
     # --- Special handling for mode="I" ---
     if mode == "I":
-        I_expressions = re.findall(r"I\((.*?)\)", lhs)
+        I_expressions = _find_I_expressions(lhs)
         I_vars = set()
         for expr in I_expressions:
-            I_vars.update(re.findall(r"[A-Za-z_]\w*", expr))
+            I_vars.update(_IDENT_RE.findall(expr))
         raw_vars = {v for v in raw_vars if v in I_vars}
 
-    # --- Validate identifiers ---
-    raw_vars = {v for v in raw_vars if re.match(r"^[A-Za-z_]\w*$", v)}
+    # Interned names make later comparisons with (interned) column names cheap
+    return frozenset(sys.intern(v) for v in raw_vars)
+
+
+@functools.lru_cache(maxsize=256)
+def _extract_variables_cached(formula: str, mode: str) -> frozenset:
+    """Parse ``formula`` for ``extract_variables``; the result is cached."""
+    lhs, target_expr = _split_formula(formula, mode)
+
+    # --- Extract identifiers, both standalone and inside I(), scale(), C(), etc. ---
+    # A single scan is enough: names inside function calls are plain
+    # identifiers too, and numeric literals never match the pattern.
+    return _select_variables(_IDENT_RE.findall(target_expr), lhs, mode)
+
 
-    return raw_vars
+extract_variables.cache_clear = _extract_variables_cached.cache_clear
 
 
 import pandas as pd
@@ -26,13 +26,83 @@ from __future__ import annotations
 
 import logging
 import os
-from pathlib import Path
-from typing import Any, Optional, Union
+from concurrent.futures import Future as ConcurrentFuture
+from dataclasses import dataclass
+from typing import Any, List, Optional, Sequence, Union
 
 import ee  # Earth Engine
 import geedim as gd  # used only inside the worker – imported here for typing
 import geemap  # (only required for its'ee_export_vector' fallback)
-from dask.distributed import Client, Future
+from dask.distributed import Client, Future, as_completed
+
+from component.script.utilities.dask_helpers import (
+    complete_on_disk,
+    complete_on_disk_many,
+    completed_future,
+    register_pre_import,
+    scatter_serialized,
+    serialize_once,
+)
+
+# Modules imported once per worker (see ``register_pre_import``)
+_WORKER_MODULES = ("ee", "geedim", "geemap")
+
+# Set when building the docs with MkDocs; checked once at import time.
+_MKDOCS_BUILD = os.environ.get("USE_MKDOCS") is not None
+
+
+# ------------------------------------------------------------------
+# Export settings shared by a batch of files
+# ------------------------------------------------------------------
+@dataclass(frozen=True, slots=True)
+class ExportRecipe:
+    """
+    Raster export settings, built once and shared by every file of a batch.
+
+    The recipe is immutable and hashable, so it is sent to the workers as a
+    single small object instead of a fresh keyword dictionary per file.
+
+    Attributes
+    ----------
+    crs : str
+        CRS in EPSG or WKT notation to reproject the image to.
+    scale : float
+        Desired pixel resolution (meters).
+    resampling : str
+        Resampling method 'near', 'bilinear', 'bicubic', or 'average'.
+    dtype : str | None
+        Output data type.  Defaults to auto select.
+    overwrite : bool
+        Overwrite the destination file if it exists.
+    unmask_value : int | None
+        Value used for masked pixels.
+    nodata_value : float | None
+        Value used for no data raster value.
+    extra : tuple
+        Additional ''(name, value)'' pairs forwarded to''download_ee_image''.
+    """
+
+    crs: str
+    scale: float
+    resampling: str = "near"
+    dtype: Optional[str] = None
+    overwrite: bool = True
+    unmask_value: Optional[int] = None
+    nodata_value: Optional[float] = None
+    extra: tuple = ()
+
+    def download_kwargs(self) -> dict[str, Any]:
+        """Return the keyword arguments for''download_ee_image''."""
+        return {
+            "crs": self.crs,
+            "scale": self.scale,
+            "resampling": self.resampling,
+            "dtype": self.dtype,
+            "overwrite": self.overwrite,
+            "unmask_value": self.unmask_value,
+            "nodata_value": self.nodata_value,
+            **dict(self.extra),
+        }
 
 
 # ------------------------------------------------------------------
@@ -49,8 +119,9 @@ def export_raster_with_dask(
     client: Client = None,
     project: [str] = None,
     overwrite: bool = False,
+    cog: bool = True,
     **kwargs: Any,
-) -> Future:
+) -> Future | ConcurrentFuture:
     """
     Export an Earth-Engine image to a GeoTIFF via Dask.
 
@@ -77,27 +148,35 @@ def export_raster_with_dask(
     project : str | None, optional
         Earth Engine project name.  If omitted the default EE project will be used.
     overwrite : bool, optional
-        If False (default), the function will skip export if the file already exists.
+        If False (default), the function will skip export if the file already exists
+        and is not empty.
         If True, the function will overwrite existing files.
+    cog : bool, optional
+        If True (default), write a Cloud Optimized GeoTIFF (tiled and
+        compressed) instead of a plain GeoTIFF.
     **kwargs : Any
         Additional keyword arguments forwarded verbatim to''download_ee_image''
         (e.g.''overwrite=True'',''resampling="bilinear"'', etc.).
 
     Returns:
     -------
-    dask.distributed.Future
+    dask.distributed.Future | concurrent.futures.Future
         Future that resolves to the result of'download_ee_image'
-        (normally''None'' you use it for its side effects).
+        (normally''None'' you use it for its side effects).  When the export
+        is skipped because the file exists, an already-resolved
+        ''concurrent.futures.Future'' is returned instead.
     """
     # ------------------------------------------------------------------
     # 1. Check if file exists and overwrite is False
     # ------------------------------------------------------------------
-    if not overwrite and Path(filename).exists():
+    if not overwrite and complete_on_disk(filename):
         logging.warning(
             f"File {filename} already exists and overwrite=False. Skipping export."
         )
-        # Return a completed future to continue execution without error
-        return client.submit(lambda: None)
+        # Return an already-resolved future; nothing is sent to the scheduler
+        return completed_future()
+
+    kwargs.setdefault("driver", "cog" if cog else "gtiff")
 
     # ------------------------------------------------------------------
     # 2. Ensure Earth Engine is initialised locally
@@ -106,65 +185,21 @@ def export_raster_with_dask(
     #     ee.Initialize(project=project)
 
     # ------------------------------------------------------------------
-    # 3. Serialise the EE objects so they can be sent to a worker
+    # 3. Serialise the EE objects so they can be sent to a worker.
+    #    The image JSON is serialised and broadcast once per image, so
+    #    repeated exports of the same image reuse the payload on workers.
     # ------------------------------------------------------------------
-    ee_img_json = ee_img.serialize()
+    ee_img_json = scatter_serialized(client, ee_img)
     region_json: Optional[str] = None
     if region_geom is not None:
-        region_json = region_geom.serialize()
-
-    # ------------------------------------------------------------------
-    # 4. Worker function – runs on a Dask worker
-    # ------------------------------------------------------------------
-    def _raster_export(
-        img_json: str,
-        fn: str,
-        scl: int | float,
-        crs_name: str,
-        reg_json: Optional[str],
-        um_val: Optional[int],
-        nd_val: Optional[int],
-        proj: [str] = None,
-        overw: bool = False,
-        **kw: Any,
-    ) -> Any:
-        """
-        Minimal wrapper that reinitialises EE and calls''download_ee_image''.
-        All arguments are typed for clarity.
-        """
-        import ee  # Import inside the worker
-        import geedim as gd
-
-        ee.Initialize(project=proj)
-
-        img = ee.deserializer.fromJSON(img_json)
-        region: Optional[Union[ee.Geometry, ee.FeatureCollection]] = None
-        if reg_json is not None:
-            region = ee.deserializer.fromJSON(reg_json)
-
-        # If'unmask_value' is supplied we apply it before export.
-        if um_val is not None and isinstance(
-            region, (ee.Geometry, ee.FeatureCollection)
-        ):
-            img = img.unmask(um_val, sameFootprint=False).clip(region)
-
-        return download_ee_image(
-            image=img,
-            filename=fn,
-            scale=scl,
-            crs=crs_name,
-            region=region,
-            unmask_value=um_val,
-            nodata_value=nd_val,
-            overwrite=overw,
-            **kw,
-        )
+        region_json = serialize_once(region_geom)
 
     # ------------------------------------------------------------------
     # 4. Submit the task to Dask and return the Future
     # ------------------------------------------------------------------
+    register_pre_import(client, _WORKER_MODULES)
     return client.submit(
-        _raster_export,
+        _raster_export_impl,
         ee_img_json,
         filename,
         scale,
@@ -173,11 +208,200 @@ def export_raster_with_dask(
         unmask_value,
         nodata_value,
         proj=project,
-        overw=overwrite,
+        # Only missing or incomplete (empty) files reach this point, so the
+        # worker may always replace what is on disk.
+        overw=True,
         **kwargs,
     )
 
 
+def export_rasters_with_dask(
+    ee_img: ee.Image,
+    filenames: Sequence[str],
+    scale: float,
+    crs: str,
+    region_geoms: Optional[
+        Sequence[Union[ee.Geometry, ee.FeatureCollection, None]]
+    ] = None,
+    unmask_value: Optional[int] = None,
+    nodata_value: Optional[float] = None,
+    client: Client = None,
+    project: [str] = None,
+    overwrite: bool = False,
+    cog: bool = True,
+    **kwargs: Any,
+) -> List[str]:
+    """
+    Export one Earth-Engine image to several GeoTIFFs (e.g. tiles) via Dask.
+
+    Batch counterpart of :func:'export_raster_with_dask': the image is
+    serialised and broadcast to the workers once, the region geometries are
+    scattered in a single call and all tasks are submitted with one
+    ''client.map''.  The call waits for the exports, collecting each result
+    as soon as it finishes (''as_completed'') so finished tasks do not pile
+    up on the workers.
+
+    Parameters
+    ----------
+    ee_img : ee.Image
+        The EE image you want to download.
+    filenames : Sequence[str]
+        Target file path of each exported GeoTIFF.
+    scale : float
+        Desired pixel resolution (meters).
+    crs : str
+        CRS in EPSG or WKT notation to reproject the image to.
+    region_geoms : Sequence[ee.Geometry | ee.FeatureCollection | None] | None, optional
+        Export window for each file, aligned with ''filenames''.  If''None'',
+        the entire image granule is exported to every file.
+    unmask_value : float | None, optional
+        Value used for masked pixels.
+    nodata_value : int | None, optional
+        Value used for no data raster value.
+    client : dask.distributed.Client
+        The Dask client that will run the export jobs.
+    project : str | None, optional
+        Earth Engine project name.  If omitted the default EE project will be used.
+    overwrite : bool, optional
+        If False (default), files that already exist and are not empty are skipped.
+    cog : bool, optional
+        If True (default), write Cloud Optimized GeoTIFFs.
+    **kwargs : Any
+        Additional keyword arguments forwarded verbatim to''download_ee_image''.
+
+    Returns:
+    -------
+    list[str]
+        The files exported by this call, in the order of ''filenames''.
+        Files skipped because they already exist are not included.
+    """
+    if region_geoms is None:
+        region_geoms = [None] * len(filenames)
+    if len(region_geoms) != len(filenames):
+        raise ValueError("`region_geoms` must have the same length as `filenames`.")
+
+    kwargs.setdefault("driver", "cog" if cog else "gtiff")
+
+    # Skip the files that already exist (one directory listing per folder)
+    done = [False] * len(filenames) if overwrite else complete_on_disk_many(filenames)
+    jobs = []
+    for filename, region_geom, is_done in zip(filenames, region_geoms, done):
+        if is_done:
+            logging.warning(
+                f"File {filename} already exists and overwrite=False. Skipping export."
+            )
+            continue
+        jobs.append((filename, region_geom))
+
+    if not jobs:
+        return []
+
+    # Build the export settings once for the whole batch.  Only missing or
+    # incomplete (empty) files are left, so the workers may always overwrite.
+    recipe = ExportRecipe(
+        crs=crs,
+        scale=scale,
+        resampling=kwargs.pop("resampling", "near"),
+        dtype=kwargs.pop("dtype", None),
+        overwrite=True,
+        unmask_value=unmask_value,
+        nodata_value=nodata_value,
+        extra=tuple(sorted(kwargs.items())),
+    )
+
+    # Ship the heavy shared payload once, the per-file regions in one call
+    n = len(jobs)
+    img_future = scatter_serialized(client, ee_img)
+    region_jsons = [
+        serialize_once(region_geom) if region_geom is not None else None
+        for _, region_geom in jobs
+    ]
+    region_futures = client.scatter(region_jsons)
+
+    register_pre_import(client, _WORKER_MODULES)
+    futures = client.map(
+        _raster_export_recipe_impl,
+        [img_future] * n,
+        [filename for filename, _ in jobs],
+        region_futures,
+        recipe=recipe,
+        proj=project,
+        pure=False,
+    )
+
+    # Back-pressure: release each result as soon as its task finishes
+    for future in as_completed(futures):
+        future.result()
+        future.release()
+    return [filename for filename, _ in jobs]
+
+
+# ------------------------------------------------------------------
+#  Worker function – runs on a Dask worker
+# ------------------------------------------------------------------
+def _raster_export_impl(
+    img_json: str,
+    fn: str,
+    scl: int | float,
+    crs_name: str,
+    reg_json: Optional[str],
+    um_val: Optional[int],
+    nd_val: Optional[int],
+    proj: [str] = None,
+    overw: bool = False,
+    **kw: Any,
+) -> Any:
+    """
+    Minimal wrapper that reinitialises EE and calls''download_ee_image''.
+    All arguments are typed for clarity.
+
+    Defined at module level so Dask pickles it by reference instead of
+    serialising a new closure with every submitted task.
+    """
+    ee.Initialize(project=proj)
+
+    img = ee.deserializer.fromJSON(img_json)
+    region: Optional[Union[ee.Geometry, ee.FeatureCollection]] = None
+    if reg_json is not None:
+        region = ee.deserializer.fromJSON(reg_json)
+
+    # Clipping to the region polygon and unmasking are applied once, by
+    # ''download_ee_image''; the worker must not repeat them.
+    return download_ee_image(
+        image=img,
+        filename=fn,
+        scale=scl,
+        crs=crs_name,
+        region=region,
+        unmask_value=um_val,
+        nodata_value=nd_val,
+        overwrite=overw,
+        **kw,
+    )
+
+
+def _raster_export_recipe_impl(
+    img_json: str,
+    fn: str,
+    reg_json: Optional[str],
+    recipe: ExportRecipe,
+    proj: [str] = None,
+) -> Any:
+    """
+    Batch variant of''_raster_export_impl'' driven by an''ExportRecipe''.
+    """
+    ee.Initialize(project=proj)
+
+    img = ee.deserializer.fromJSON(img_json)
+    region: Optional[Union[ee.Geometry, ee.FeatureCollection]] = None
+    if reg_json is not None:
+        region = ee.deserializer.fromJSON(reg_json)
+
+    return download_ee_image(
+        image=img, filename=fn, region=region, **recipe.download_kwargs()
+    )
+
+
 # ------------------------------------------------------------------
 #  Helper that actually performs the download
 # ------------------------------------------------------------------
@@ -240,6 +464,10 @@ def download_ee_image(
         Value used for masked pixels.  Set to a non zero value if you want zeros to be treated as data.
     nodata_value : int | None, optional
         Value used for no data raster value.
+    **kwargs : Any
+        Forwarded to geedim's ``toGeoTIFF``.  ``driver`` defaults to ``"cog"``
+        (tiled, compressed Cloud Optimized GeoTIFF); pass ``driver="gtiff"``
+        for a plain GeoTIFF.
 
     Returns:
     -------
@@ -248,7 +476,7 @@ def download_ee_image(
     """
     # The original implementation has an early exit when running under MkDocs,
     # which we preserve for compatibility.
-    if getattr(os, "environ", {}).get("USE_MKDOCS") is not None:
+    if _MKDOCS_BUILD:
         return
 
     try:
@@ -262,7 +490,9 @@ def download_ee_image(
     if not isinstance(image, ee.Image):  # pragma: no cover
         raise ValueError("image must be an ee.Image.")
 
-    # Apply unmasking/clip logic before export.
+    # Apply unmasking/clip logic before export.  Clip first:
+    # prepareForExport(region=...) only restricts the export to the region's
+    # bounding box, so the polygon mask must be applied here before unmasking.
     if unmask_value is not None:
         if isinstance(region, (ee.Geometry, ee.FeatureCollection)):
             image = image.clip(region)
@@ -276,6 +506,7 @@ def download_ee_image(
         dtype=dtype,
     )
 
+    kwargs.setdefault("driver", "cog")
     if nodata_value is None:
         img.gd.toGeoTIFF(file=filename, overwrite=overwrite, nodata=True, **kwargs)
     elif nodata_value is not None:
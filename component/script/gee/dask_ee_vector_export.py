@@ -21,12 +21,23 @@ arguments.
 from __future__ import annotations
 
 import logging
-from pathlib import Path
+from concurrent.futures import Future as ConcurrentFuture
 from typing import Any, List, Optional, Union
 
 import ee  # Earth Engine
+import geemap
 from dask.distributed import Client, Future
 
+from component.script.utilities.dask_helpers import (
+    complete_on_disk,
+    completed_future,
+    register_pre_import,
+    serialize_once,
+)
+
+# Modules imported once per worker (see ``register_pre_import``)
+_WORKER_MODULES = ("ee", "geemap")
+
 
 # ------------------------------------------------------------------
 # Public helper
@@ -39,7 +50,7 @@ def export_vector_with_dask(
     client: Client = None,
     project: str = None,
     **kwargs: Any,
-) -> Future:
+) -> Future | ConcurrentFuture:
     """
     Export an Earth Engine object to a Shapefile using Dask.
 
@@ -50,7 +61,8 @@ def export_vector_with_dask(
     filename : str
         Path where the exported Shapefile (or ZIP) should be written.
     overwrite : bool, optional
-        If False (default), the function will skip export if the file already exists.
+        If False (default), the function will skip export if the file already exists
+        and is not empty.
         If True, the function will overwrite existing files.
     client : dask.distributed.Client
         The Dask client that will submit the export job.
@@ -63,19 +75,21 @@ def export_vector_with_dask(
 
     Returns:
     -------
-    dask.distributed.Future
+    dask.distributed.Future | concurrent.futures.Future
         Future that resolves to the result of `geemap.ee_export_vector`
         (usually ``None``; you may use it purely for its side effects).
+        When the export is skipped because the file exists, an
+        already-resolved ``concurrent.futures.Future`` is returned instead.
     """
     # ------------------------------------------------------------------
     # 1. Check if file exists and overwrite is False
     # ------------------------------------------------------------------
-    if not overwrite and Path(filename).exists():
+    if not overwrite and complete_on_disk(filename):
         logging.warning(
             f"File {filename} already exists and overwrite=False. Skipping export."
         )
-        # Return a completed future to continue execution without error
-        return client.submit(lambda: None)
+        # Return an already-resolved future; nothing is sent to the scheduler
+        return completed_future()
 
     # ------------------------------------------------------------------
     # 2. Ensure Earth Engine is initialised locally
@@ -86,45 +100,14 @@ def export_vector_with_dask(
     # ------------------------------------------------------------------
     # 3. Serialise the EE object so it can be sent to a worker
     # ------------------------------------------------------------------
-    ee_json = ee_fc.serialize()
-
-    # ------------------------------------------------------------------
-    # 4. Worker function - runs on a Dask worker
-    # ------------------------------------------------------------------
-    def _vector_export(
-        ee_object_json,
-        fn: str,
-        sel: Optional[List[str]],
-        project: str,
-        **kw: Any,
-    ) -> Any:
-        """
-        Minimal wrapper that reinitialises EE and calls `geemap.ee_export_vector`.
-
-        Parameters are intentionally typed to aid static analysis.
-        """
-        import ee  # Import inside the worker
-        import geemap
-
-        ee.Initialize(project=project)
-
-        ee_obj_local = ee.deserializer.fromJSON(ee_object_json)
-
-        return geemap.ee_export_vector(
-            ee_object=ee_obj_local,
-            filename=fn,
-            selectors=sel or [],
-            keep_zip=False,  # default used in the example
-            timeout=600,
-            verbose=False,
-            **kw,
-        )
+    ee_json = serialize_once(ee_fc)
 
     # ------------------------------------------------------------------
     # 4. Submit the task to Dask and return the Future
     # ------------------------------------------------------------------
+    register_pre_import(client, _WORKER_MODULES)
     return client.submit(
-        _vector_export,
+        _vector_export_impl,
         ee_json,
         filename,
         selectors,
@@ -133,6 +116,38 @@ def export_vector_with_dask(
     )
 
 
+# ------------------------------------------------------------------
+# Worker function - runs on a Dask worker
+# ------------------------------------------------------------------
+def _vector_export_impl(
+    ee_object_json,
+    fn: str,
+    sel: Optional[List[str]],
+    project: str,
+    **kw: Any,
+) -> Any:
+    """
+    Minimal wrapper that reinitialises EE and calls `geemap.ee_export_vector`.
+
+    Parameters are intentionally typed to aid static analysis. Defined at
+    module level so Dask pickles it by reference instead of serialising a
+    new closure with every submitted task.
+    """
+    ee.Initialize(project=project)
+
+    ee_obj_local = ee.deserializer.fromJSON(ee_object_json)
+
+    return geemap.ee_export_vector(
+        ee_object=ee_obj_local,
+        filename=fn,
+        selectors=sel or [],
+        keep_zip=False,  # default used in the example
+        timeout=600,
+        verbose=False,
+        **kw,
+    )
+
+
 # ------------------------------------------------------------------
 # Example usage (uncomment for quick test)
 # ------------------------------------------------------------------
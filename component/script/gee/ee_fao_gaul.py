@@ -5,8 +5,24 @@ This module provides functions for downloading and working with FAO GAUL (Global
 from Google Earth Engine.
 """
 
+import functools
+from typing import Iterable
+
 import ee
 
+# FAO GAUL 2024 paths
+_GAUL_PATHS = {
+    0: "projects/sat-io/open-datasets/FAO/GAUL/GAUL_2024_L0",
+    1: "projects/sat-io/open-datasets/FAO/GAUL/GAUL_2024_L1",
+    2: "projects/sat-io/open-datasets/FAO/GAUL/GAUL_2024_L2",
+}
+
+
+@functools.lru_cache(maxsize=3)
+def _gaul_fc(level: int) -> ee.FeatureCollection:
+    """Return the (cached) FAO GAUL 2024 FeatureCollection for ``level``."""
+    return ee.FeatureCollection(_GAUL_PATHS[level])
+
 
 def get_fao_gaul_features(
     level: int, code: str, filter_attribute: str = "iso3_code"
@@ -48,25 +64,53 @@ def get_fao_gaul_features(
     in your script or notebook.
     """
 
-    # Validate inputs
-    if level not in (0, 1, 2):
-        raise ValueError("`level` must be 0, 1, or 2.")
-
     if not code:
         raise ValueError("`code` must be provided.")
 
-    # Define FAO GAUL 2024 paths
-    gaul_paths = {
-        0: "projects/sat-io/open-datasets/FAO/GAUL/GAUL_2024_L0",
-        1: "projects/sat-io/open-datasets/FAO/GAUL/GAUL_2024_L1",
-        2: "projects/sat-io/open-datasets/FAO/GAUL/GAUL_2024_L2",
-    }
+    return get_fao_gaul_features_batch(level, [code], filter_attribute)
 
-    # Get the FeatureCollection for the specified level
-    fao_gaul_fc = ee.FeatureCollection(gaul_paths[level])
 
-    # Select features based on the code using the filter attribute
-    selected_features = fao_gaul_fc.filter(ee.Filter.eq(filter_attribute, code))
+def get_fao_gaul_features_batch(
+    level: int, codes: Iterable[str], filter_attribute: str = "iso3_code"
+) -> ee.FeatureCollection:
+    """
+    Selects features from FAO GAUL 2024 dataset matching any of the codes provided.
+
+    Equivalent to merging ``get_fao_gaul_features`` over several codes, but the
+    selection is done with a single server-side ``ee.Filter.inList`` filter.
+
+    Parameters
+    ----------
+    level : int
+        The administrative level to select (0, 1, or 2).
+    codes : Iterable[str]
+        ISO-3 country codes for level 0, or ADM1_CODE / ADM2_CODE values for
+        levels 1 and 2 (e.g. ["BRA", "PER"]).
+    filter_attribute : str, optional
+        The attribute name to use for filtering. Default is "iso3_code".
+
+    Returns
+    -------
+    ee.FeatureCollection
+        The selected FeatureCollection from the FAO GAUL 2024 dataset.
+
+    Raises
+    ------
+    ValueError
+        If level is not 0, 1, or 2, or if no code is provided.
+    """
+    # Validate inputs
+    if level not in (0, 1, 2):
+        raise ValueError("`level` must be 0, 1, or 2.")
+
+    codes = list(codes)
+    if not codes:
+        raise ValueError("`codes` must contain at least one code.")
+
+    # Select features based on the codes using the filter attribute
+    selected_features = _gaul_fc(level).filter(
+        ee.Filter.inList(filter_attribute, ee.List(codes))
+    )
 
     return selected_features
 
@@ -101,25 +145,24 @@ def get_fao_gaul_subj(level: int, feature_collection: ee.FeatureCollection):
     if level not in (1, 2):
         raise ValueError("`level` must be 1 or 2.")
 
-    # Define FAO GAUL 2024 paths
-    gaul_paths = {
-        1: "projects/sat-io/open-datasets/FAO/GAUL/GAUL_2024_L1",
-        2: "projects/sat-io/open-datasets/FAO/GAUL/GAUL_2024_L2",
-    }
-
     gaul_names_attribute = {
         1: "gaul1_name",
         2: "gaul2_name",
     }
 
     # Get the FeatureCollection for the specified level
-    fao_gaul_fc = ee.FeatureCollection(gaul_paths[level])
+    fao_gaul_fc = _gaul_fc(level)
 
     # Get the attribute name for the specified level
     fao_gaul_attribute = gaul_names_attribute[level]
 
-    # Select features based on the geometry of the provided feature collection
-    selected_features = fao_gaul_fc.filterBounds(feature_collection.geometry())
+    # Select features based on the geometry of the provided feature collection.
+    # The bounding box is a cheap first cut for the spatial index; only the
+    # remaining candidates are tested against the exact geometry.
+    geometry = feature_collection.geometry()
+    selected_features = fao_gaul_fc.filterBounds(geometry.bounds()).filterBounds(
+        geometry
+    )
 
     # You might want to use fao_gaul_attribute here for further operations
     # For example, you could select features based on this attribute
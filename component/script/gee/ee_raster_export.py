@@ -70,6 +70,10 @@ def download_ee_image(
         treated as data.
     nodata_value : int | None, optional
         Value used for no data raster value.
+    **kwargs : Any
+        Forwarded to geedim's ``toGeoTIFF``.  ``driver`` defaults to ``"cog"``
+        (tiled, compressed Cloud Optimized GeoTIFF); pass ``driver="gtiff"``
+        for a plain GeoTIFF.
 
     Returns:
     -------
@@ -87,7 +91,9 @@ def download_ee_image(
     if not isinstance(image, ee.Image):  # pragma: no cover
         raise ValueError("image must be an ee.Image.")
 
-    # Apply unmasking/clip logic before export.
+    # Apply unmasking/clip logic before export.  Clip first:
+    # prepareForExport(region=...) only restricts the export to the region's
+    # bounding box, so the polygon mask must be applied here before unmasking.
     if unmask_value is not None:
         if isinstance(region, (ee.Geometry, ee.FeatureCollection)):
             image = image.clip(region)
@@ -101,6 +107,7 @@ def download_ee_image(
         dtype=dtype,
     )
 
+    kwargs.setdefault("driver", "cog")
     if nodata_value is None:
         img.gd.toGeoTIFF(file=filename, overwrite=overwrite, nodata=True, **kwargs)
     elif nodata_value is not None:
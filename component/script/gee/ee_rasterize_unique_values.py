@@ -3,7 +3,9 @@ from typing import Any
 
 
 def gee_rasterize_unique_values(
-    feature_collection: ee.FeatureCollection, property_name: str
+    feature_collection: ee.FeatureCollection,
+    property_name: str,
+    numeric_property: bool = False,
 ) -> ee.Image:
     """
     Assign consecutive numbers to unique values of a specified column in a FeatureCollection.
@@ -11,17 +13,26 @@ def gee_rasterize_unique_values(
     Args:
         feature_collection (ee.FeatureCollection): The input FeatureCollection.
         property_name (str): The name of the column containing unique values.
+        numeric_property (bool): Set to True when the column holds numbers. The
+            column is then rasterized directly and remapped server-side, which
+            avoids setting a new property on every feature. String columns
+            (the default) cannot be rasterized and keep the per-feature mapping.
 
     Returns:
         ee.Image: An image where each pixel represents the consecutive number assigned to the unique values.
     """
     # Get the unique values of the specified column
     unique_values = feature_collection.aggregate_array(property_name).distinct()
+    consecutive_numbers = ee.List.sequence(1, unique_values.length())
+
+    if numeric_property:
+        # Rasterize the raw values once and remap them to consecutive numbers
+        return feature_collection.reduceToImage(
+            [property_name], ee.Reducer.first()
+        ).remap(unique_values, consecutive_numbers)
 
     # Create a mapping from unique values to consecutive numbers
-    value_to_number_map = ee.Dictionary.fromLists(
-        unique_values, ee.List.sequence(1, unique_values.length())
-    )
+    value_to_number_map = ee.Dictionary.fromLists(unique_values, consecutive_numbers)
 
     # Function to assign the consecutive number to each feature
     def assign_number(feature: ee.Feature) -> ee.Feature:
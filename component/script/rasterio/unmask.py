@@ -1,32 +1,82 @@
+import os
+import shutil
+
+import numba
 import rasterio
+from rasterio.windows import Window
+
+# Rows processed per window; matches the output tile height.
+_WINDOW_ROWS = 512
+
+
+@numba.njit(parallel=True, cache=True)
+def _replace_nodata(data, nodata):
+    """Set pixels equal to ``nodata`` to 0, in place, in a single pass."""
+    rows, cols = data.shape
+    for i in numba.prange(rows):
+        for j in range(cols):
+            if data[i, j] == nodata:
+                data[i, j] = 0
+
+
+def _row_windows(dataset):
+    """Yield full-width windows of ``_WINDOW_ROWS`` rows covering ``dataset``."""
+    for row in range(0, dataset.height, _WINDOW_ROWS):
+        yield Window(0, row, dataset.width, min(_WINDOW_ROWS, dataset.height - row))
 
 
 def unmask_raster(input_file, output_file):
     """
     Unmasks pixel values in a raster file by setting existing no-data values to 0
     and updating the metadata to reflect that the new no-data value is 255.
+
+    The raster is processed in strips of 512 rows (one row of output tiles),
+    so memory use stays bounded regardless of the raster size. The output is
+    written as a tiled (512x512), deflate-compressed GeoTIFF.
+
+    When the input has no no-data value, or its no-data value is already 0,
+    no pixel changes: the file is copied and only its metadata is updated.
+    When ``output_file`` is ``input_file``, the raster is updated in place.
+
     Parameters:
         input_file (str): Path to the input raster file.
         output_file (str): Path to the output raster file.
     """
+    if os.path.exists(output_file) and os.path.samefile(input_file, output_file):
+        # Same file: rewrite the no-data pixels and the metadata in place
+        with rasterio.open(output_file, "r+") as dst:
+            nodata = dst.nodata
+            if nodata is not None and nodata != 0:
+                for window in _row_windows(dst):
+                    data = dst.read(1, window=window)
+                    _replace_nodata(data, nodata)
+                    dst.write(data, 1, window=window)
+            dst.nodata = 255  # Update the no-data value in metadata
+        return
+
     # Open the input raster file
     with rasterio.open(input_file) as src:
-        # Read the raster data into a NumPy array
-        data = src.read(1)  # Assuming single-band raster
-
         # Get the current no-data value from metadata
         nodata = src.nodata
 
-        if nodata is not None:
-            # Create a mask for existing no-data values
-            no_data_mask = data == nodata
-            # Set the no-data value to 0
-            data[no_data_mask] = 0
+        if nodata is not None and nodata != 0:
+            # Define the metadata for the output file
+            meta = src.meta.copy()
+            meta["nodata"] = 255  # Update the no-data value in metadata
+            meta.update(
+                tiled=True, blockxsize=512, blockysize=512, compress="deflate"
+            )
 
-        # Define the metadata for the output file
-        meta = src.meta.copy()
-        meta["nodata"] = 255  # Update the no-data value in metadata
+            with rasterio.open(output_file, "w", **meta) as dst:
+                # Assuming single-band raster
+                for window in _row_windows(src):
+                    data = src.read(1, window=window)
+                    # Set the no-data value to 0, in place
+                    _replace_nodata(data, nodata)
+                    dst.write(data, 1, window=window)
+            return
 
-    # Write the updated data and metadata to a new raster file
-    with rasterio.open(output_file, "w", **meta) as dst:
-        dst.write(data, 1)
+    # Nothing to unmask: copy the file and only patch the metadata
+    shutil.copyfile(input_file, output_file)
+    with rasterio.open(output_file, "r+") as dst:
+        dst.nodata = 255  # Update the no-data value in metadata
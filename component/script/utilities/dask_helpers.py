@@ -0,0 +1,212 @@
+"""
+Small helpers shared by the Dask task wrappers.
+"""
+
+import importlib
+import os
+import weakref
+from concurrent.futures import Future
+from typing import Any, Iterable
+
+from dask.distributed import Client, WorkerPlugin
+
+# id(obj) -> (weakref to obj, serialized JSON, {client id: scattered future}).
+# Entries are dropped as soon as the serialized object is garbage collected.
+_SERIAL_CACHE: dict[int, tuple[weakref.ref, str, dict]] = {}
+
+# (client id, plugin name) pairs already registered by ``register_pre_import``.
+_REGISTERED_PLUGINS: set[tuple[str, str]] = set()
+
+
+def completed_future(result: Any = None) -> Future:
+    """
+    Return a future that is already resolved to ``result``.
+
+    Used by the ``*_with_dask`` wrappers when a task is skipped (e.g. the
+    output file already exists): callers can still call ``.result()`` on the
+    return value, but no task is sent to the scheduler or the workers.
+
+    Parameters
+    ----------
+    result : Any, optional
+        Value returned by ``Future.result()``. Defaults to ``None``.
+
+    Returns
+    -------
+    concurrent.futures.Future
+        A finished future.
+    """
+    future: Future = Future()
+    future.set_result(result)
+    return future
+
+
+def complete_on_disk(filename: str) -> bool:
+    """
+    Return True if ``filename`` exists and is not empty.
+
+    Used for the "skip if already exported" check: a single ``os.stat`` call,
+    and empty files left behind by an interrupted worker are not treated as
+    done, so they get exported again.
+
+    Parameters
+    ----------
+    filename : str
+        Path of the expected output file.
+
+    Returns
+    -------
+    bool
+        Whether the file exists with a non-zero size.
+    """
+    try:
+        return os.stat(filename).st_size > 0
+    except FileNotFoundError:
+        return False
+
+
+def complete_on_disk_many(filenames: Iterable[str]) -> list[bool]:
+    """
+    Batch version of :func:`complete_on_disk`.
+
+    Files are grouped by directory and each directory is listed once with
+    ``os.scandir``; only the entries that were asked for are ``stat``-ed.
+    Missing files therefore cost no syscall of their own.
+
+    Parameters
+    ----------
+    filenames : Iterable[str]
+        Paths of the expected output files.
+
+    Returns
+    -------
+    list[bool]
+        For each file, in order, whether it exists with a non-zero size.
+    """
+    keys = []
+    wanted: dict[str, set[str]] = {}
+    for filename in filenames:
+        directory, name = os.path.split(os.fspath(filename))
+        directory = directory or os.curdir
+        keys.append((directory, name))
+        wanted.setdefault(directory, set()).add(name)
+
+    complete = set()
+    for directory, names in wanted.items():
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.name not in names:
+                        continue
+                    # A dangling symlink or unreadable entry only counts as
+                    # missing itself; the rest of the directory is still read.
+                    try:
+                        size = entry.stat().st_size
+                    except OSError:
+                        continue
+                    if size > 0:
+                        complete.add((directory, entry.name))
+        except OSError:
+            # Missing or unreadable directory: its files count as missing
+            continue
+    return [key in complete for key in keys]
+
+
+def _serial_cache_entry(obj: Any) -> tuple[weakref.ref, str, dict]:
+    """Return the cache entry for ``obj``, serializing it on first use."""
+    key = id(obj)
+    entry = _SERIAL_CACHE.get(key)
+    if entry is None or entry[0]() is not obj:
+
+        def _evict(ref: weakref.ref, key: int = key) -> None:
+            if _SERIAL_CACHE.get(key, (None,))[0] is ref:
+                del _SERIAL_CACHE[key]
+
+        entry = (weakref.ref(obj, _evict), obj.serialize(), {})
+        _SERIAL_CACHE[key] = entry
+    return entry
+
+
+def serialize_once(obj: Any) -> str:
+    """
+    Return ``obj.serialize()``, computing it only once per object.
+
+    Earth Engine objects are immutable, so exporting many tiles of the same
+    ``ee.Image`` can reuse a single JSON payload.
+
+    Parameters
+    ----------
+    obj : ee.ComputedObject
+        Any object with a ``serialize()`` method.
+
+    Returns
+    -------
+    str
+        The serialized JSON of ``obj``.
+    """
+    return _serial_cache_entry(obj)[1]
+
+
+def scatter_serialized(client: Any, obj: Any) -> Any:
+    """
+    Broadcast the serialized JSON of ``obj`` to all workers of ``client``.
+
+    The payload is scattered once per (object, client) pair; later calls
+    return the same future, so the JSON is not re-sent with every task.
+
+    Parameters
+    ----------
+    client : dask.distributed.Client
+        Client whose workers should receive the payload.
+    obj : ee.ComputedObject
+        Any object with a ``serialize()`` method.
+
+    Returns
+    -------
+    dask.distributed.Future
+        Future holding the serialized JSON, usable as a task argument.
+    """
+    _, payload, scattered = _serial_cache_entry(obj)
+    future = scattered.get(client.id)
+    if future is None or future.status != "finished":
+        future = client.scatter(payload, broadcast=True)
+        scattered[client.id] = future
+    return future
+
+
+class PreImportPlugin(WorkerPlugin):
+    """
+    Worker plugin that imports a list of modules when a worker starts.
+
+    Heavy packages (e.g. ``geemap``) are then loaded once per worker process
+    instead of during the first task that needs them.
+    """
+
+    def __init__(self, modules: Iterable[str]):
+        self.modules = tuple(modules)
+
+    def setup(self, worker: Any) -> None:
+        for module in self.modules:
+            importlib.import_module(module)
+
+
+def register_pre_import(client: Client, modules: Iterable[str]) -> None:
+    """
+    Register a :class:`PreImportPlugin` for ``modules`` on ``client``.
+
+    Registration happens at most once per client and module list, so the
+    function can be called from every ``*_with_dask`` wrapper invocation.
+
+    Parameters
+    ----------
+    client : dask.distributed.Client
+        Client whose workers should pre-import the modules.
+    modules : Iterable[str]
+        Names of the modules to import (e.g. ``["ee", "geedim"]``).
+    """
+    modules = tuple(modules)
+    name = "pre-import-" + "-".join(modules)
+    if (client.id, name) in _REGISTERED_PLUGINS:
+        return
+    client.register_plugin(PreImportPlugin(modules), name=name)
+    _REGISTERED_PLUGINS.add((client.id, name))
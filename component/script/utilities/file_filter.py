@@ -1,6 +1,19 @@
+import os
+import re
 from pathlib import Path
 from typing import List, Optional, Union
 
+import numpy as np
+
+from component.script.utilities.name_matching import (
+    VECTORIZE_MIN_CHECKS,
+    build_matcher,
+    keyword_mask,
+    multi_substring_match,
+    normalize_extensions,
+    normalize_keywords,
+)
+
 
 def list_files_by_extension(
     folder_path: str, file_extensions: Union[str, List[str]]
@@ -30,29 +43,26 @@ def list_files_by_extension(
                 f"The provided path '{folder_path}' is not a directory."
             )
 
+        # Skip notebook checkpoint folders
+        if ".ipynb_checkpoints" in folder.parts:
+            return []
+
         # Normalize extensions to include the dot prefix
         if isinstance(file_extensions, str):
             file_extensions = [file_extensions]
 
-        normalized_extensions = [
-            ext if ext.startswith(".") else f".{ext}" for ext in file_extensions
-        ]
-
-        # Get all files in the directory and filter by extension
-        matching_files = [
-            file
-            for file in folder.iterdir()
-            if file.is_file()
-            and file.suffix.lower() in [ext.lower() for ext in normalized_extensions]
-        ]
-
-        matching_files = [
-            file
-            for file in matching_files
-            if ".ipynb_checkpoints" not in Path(file).parts
-        ]
-
-        return matching_files
+        extension_set = normalize_extensions(tuple(file_extensions))
+
+        # Scan the directory once; names are matched as plain strings first,
+        # DirEntry reuses the file type from the directory listing, and Path
+        # objects are only built for matches
+        with os.scandir(folder) as entries:
+            return [
+                Path(entry.path)
+                for entry in entries
+                if os.path.splitext(entry.name)[1].lower() in extension_set
+                and entry.is_file()
+            ]
 
     except Exception as e:
         print(f"An error occurred: {e}")
@@ -75,17 +85,11 @@ def filter_files_by_extension(
     if isinstance(extensions, str):
         extensions = [extensions]
 
-    # Normalize extensions to include the dot prefix
-    normalized_extensions = [
-        ext if ext.startswith(".") else f".{ext}" for ext in extensions
-    ]
+    # Normalize extensions to include the dot prefix, once, as a set
+    extension_set = normalize_extensions(tuple(extensions))
 
     # Match any of the extensions
-    return [
-        f
-        for f in files
-        if f.suffix.lower() in [ext.lower() for ext in normalized_extensions]
-    ]
+    return [f for f in files if f.suffix.lower() in extension_set]
 
 
 def filter_files_by_include_keywords(
@@ -103,17 +107,23 @@ def filter_files_by_include_keywords(
         List of Path objects that match the criteria
     """
     # Normalize keywords to lowercase for case-insensitive matching
-    normalized_keywords = [kw.lower() for kw in keywords]
+    normalized_keywords = normalize_keywords(tuple(keywords))
+
+    files = list(files)
+    if len(files) * len(normalized_keywords) > VECTORIZE_MIN_CHECKS:
+        names = [f.name.lower() for f in files]
+        mask = keyword_mask(names, normalized_keywords, match_any)
+        return [files[i] for i in np.flatnonzero(mask)]
+
+    matcher = build_matcher(normalized_keywords)
 
     def matches_criteria(file_path: Path) -> bool:
         filename = file_path.name.lower()
 
-        if match_any:
-            # At least one keyword must be present
-            return any(keyword in filename for keyword in normalized_keywords)
-        else:
-            # All keywords must be present
-            return all(keyword in filename for keyword in normalized_keywords)
+        # At least one keyword (match_any) or all keywords must be present
+        return multi_substring_match(
+            filename, normalized_keywords, matcher, match_any
+        )
 
     return [f for f in files if matches_criteria(f)]
 
@@ -133,17 +143,23 @@ def filter_files_by_exclude_keywords(
         List of Path objects that match the criteria
     """
     # Normalize keywords to lowercase for case-insensitive matching
-    normalized_keywords = [kw.lower() for kw in keywords]
+    normalized_keywords = normalize_keywords(tuple(keywords))
+
+    files = list(files)
+    if len(files) * len(normalized_keywords) > VECTORIZE_MIN_CHECKS:
+        names = [f.name.lower() for f in files]
+        mask = ~keyword_mask(names, normalized_keywords, match_any)
+        return [files[i] for i in np.flatnonzero(mask)]
+
+    matcher = build_matcher(normalized_keywords)
 
     def matches_criteria(file_path: Path) -> bool:
         filename = file_path.name.lower()
 
-        if match_any:
-            # Exclude file if any keyword is present
-            return not any(keyword in filename for keyword in normalized_keywords)
-        else:
-            # Exclude file only if all keywords are present
-            return not all(keyword in filename for keyword in normalized_keywords)
+        # Exclude file if any keyword (match_any) or all keywords are present
+        return not multi_substring_match(
+            filename, normalized_keywords, matcher, match_any
+        )
 
     return [f for f in files if matches_criteria(f)]
 
@@ -169,44 +185,60 @@ def filter_files_by_keywords(
     Returns:
         List of Path objects that match the criteria
     """
+    # Nothing to filter on: every file matches
+    if not include_keywords and not exclude_keywords:
+        return list(files)
+
     # Normalize keywords to lowercase for case-insensitive matching
     normalized_include_keywords = (
-        [kw.lower() for kw in include_keywords] if include_keywords else []
+        normalize_keywords(tuple(include_keywords)) if include_keywords else ()
     )
     normalized_exclude_keywords = (
-        [kw.lower() for kw in exclude_keywords] if exclude_keywords else []
+        normalize_keywords(tuple(exclude_keywords)) if exclude_keywords else ()
     )
 
+    files = list(files)
+    n_keywords = len(normalized_include_keywords) + len(normalized_exclude_keywords)
+    if len(files) * n_keywords > VECTORIZE_MIN_CHECKS:
+        # Build the include and exclude masks, then combine them once
+        names = [f.name.lower() for f in files]
+        mask = np.ones(len(names), dtype=bool)
+        if include_keywords:
+            mask &= keyword_mask(
+                names, normalized_include_keywords, match_any_include
+            )
+        if exclude_keywords:
+            mask &= ~keyword_mask(
+                names, normalized_exclude_keywords, match_any_exclude
+            )
+        return [files[i] for i in np.flatnonzero(mask)]
+
+    include_matcher = build_matcher(normalized_include_keywords)
+    exclude_matcher = build_matcher(normalized_exclude_keywords)
+
     def matches_criteria(file_path: Path) -> bool:
         filename = file_path.name.lower()
 
-        # Check include criteria
+        # Check include criteria: any (match_any_include) or all must be present
         include_match = True
         if include_keywords:
-            if match_any_include:
-                # At least one include keyword must be present
-                include_match = any(
-                    keyword in filename for keyword in normalized_include_keywords
-                )
-            else:
-                # All include keywords must be present
-                include_match = all(
-                    keyword in filename for keyword in normalized_include_keywords
-                )
-
-        # Check exclude criteria
+            include_match = multi_substring_match(
+                filename,
+                normalized_include_keywords,
+                include_matcher,
+                match_any_include,
+            )
+
+        # Check exclude criteria: exclude if any (match_any_exclude) or all
+        # exclude keywords are present
         exclude_match = True
         if exclude_keywords:
-            if match_any_exclude:
-                # Exclude file if any exclude keyword is present
-                exclude_match = not any(
-                    keyword in filename for keyword in normalized_exclude_keywords
-                )
-            else:
-                # Exclude file only if all exclude keywords are present
-                exclude_match = not all(
-                    keyword in filename for keyword in normalized_exclude_keywords
-                )
+            exclude_match = not multi_substring_match(
+                filename,
+                normalized_exclude_keywords,
+                exclude_matcher,
+                match_any_exclude,
+            )
 
         # Return True only if both include and exclude criteria are satisfied
         return include_match and exclude_match
@@ -229,17 +261,16 @@ def filter_folders_by_include_keywords(
         List of Path objects that match the criteria
     """
     # Normalize keywords to lowercase for case-insensitive matching
-    normalized_keywords = [kw.lower() for kw in keywords]
+    normalized_keywords = normalize_keywords(tuple(keywords))
+    matcher = build_matcher(normalized_keywords)
 
     def matches_criteria(folder_path: Path) -> bool:
         folder_name = folder_path.name.lower()
 
-        if match_any:
-            # At least one keyword must be present
-            return any(keyword in folder_name for keyword in normalized_keywords)
-        else:
-            # All keywords must be present
-            return all(keyword in folder_name for keyword in normalized_keywords)
+        # At least one keyword (match_any) or all keywords must be present
+        return multi_substring_match(
+            folder_name, normalized_keywords, matcher, match_any
+        )
 
     return [f for f in folders if matches_criteria(f)]
 
@@ -259,24 +290,53 @@ def filter_folders_by_exclude_keywords(
         List of Path objects that match the criteria
     """
     # Normalize keywords to lowercase for case-insensitive matching
-    normalized_keywords = [kw.lower() for kw in keywords]
+    normalized_keywords = normalize_keywords(tuple(keywords))
+    matcher = build_matcher(normalized_keywords)
 
     def matches_criteria(folder_path: Path) -> bool:
         folder_name = folder_path.name.lower()
 
-        if match_any:
-            # Exclude folder if any keyword is present
-            return not any(keyword in folder_name for keyword in normalized_keywords)
-        else:
-            # Exclude folder only if all keywords are present
-            return not all(keyword in folder_name for keyword in normalized_keywords)
+        # Exclude folder if any keyword (match_any) or all keywords are present
+        return not multi_substring_match(
+            folder_name, normalized_keywords, matcher, match_any
+        )
 
     return [f for f in folders if matches_criteria(f)]
 
 
-import re
-from pathlib import Path
-from typing import List, Optional
+def filter_folders_by_keywords(
+    folders: List[Path],
+    include_keywords: Optional[List[str]] = None,
+    match_any_include: bool = True,
+    exclude_keywords: Optional[List[str]] = None,
+    match_any_exclude: bool = True,
+) -> List[Path]:
+    """
+    Filter folders by including and excluding keywords in their names.
+
+    Equivalent to ``filter_folders_by_include_keywords`` followed by
+    ``filter_folders_by_exclude_keywords``, but each folder name is lowercased
+    and checked in a single pass.
+
+    Args:
+        folders: List of folder paths to filter
+        include_keywords: List of keywords that must be present in the folder name (optional)
+        match_any_include: If True, matches any include keyword; if False, matches all include keywords
+        exclude_keywords: List of keywords that must NOT be present in the folder name (optional)
+        match_any_exclude: If True, excludes folder if any exclude keyword is present;
+                           if False, excludes folder only if all exclude keywords are present
+
+    Returns:
+        List of Path objects that match the criteria
+    """
+    # Folders are matched on ``Path.name`` exactly like files
+    return filter_files_by_keywords(
+        folders,
+        include_keywords=include_keywords,
+        match_any_include=match_any_include,
+        exclude_keywords=exclude_keywords,
+        match_any_exclude=match_any_exclude,
+    )
 
 
 def filter_files_by_keywords_strict(
@@ -304,10 +364,10 @@ def filter_files_by_keywords_strict(
 
     # Normalize keywords to lowercase for case-insensitive matching
     normalized_include_keywords = (
-        [kw.lower() for kw in include_keywords] if include_keywords else []
+        normalize_keywords(tuple(include_keywords)) if include_keywords else ()
     )
     normalized_exclude_keywords = (
-        [kw.lower() for kw in exclude_keywords] if exclude_keywords else []
+        normalize_keywords(tuple(exclude_keywords)) if exclude_keywords else ()
     )
 
     def _is_token_separate_in_name(token: str, name: str) -> bool:
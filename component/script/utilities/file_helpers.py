@@ -1,5 +1,16 @@
 from pathlib import Path
 import os
+import re
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+import numpy as np
+
+from component.script.utilities.name_matching import (
+    VECTORIZE_MIN_CHECKS,
+    keyword_mask,
+    normalize_extensions,
+    normalize_keywords,
+)
 
 
 def list_files_by_extension_os(folder_path, file_extensions):  # -> list:
@@ -15,6 +26,10 @@ def list_files_by_extension_os(folder_path, file_extensions):  # -> list:
     """
     matching_files = []
     try:
+        # Lowercased, dot-prefixed extensions, built once; suffix matching
+        # keeps multi-part extensions such as '.aux.xml' working
+        extension_suffixes = tuple(normalize_extensions(tuple(file_extensions)))
+
         # Check if the provided path is a directory
         if os.path.isdir(folder_path):
             # Iterate over all files in the directory
@@ -22,7 +37,7 @@ def list_files_by_extension_os(folder_path, file_extensions):  # -> list:
                 # Construct full file path
                 file_path = os.path.join(folder_path, filename)
                 # Check if the file has any of the specified extensions
-                if any(filename.lower().endswith(ext) for ext in file_extensions):
+                if filename.lower().endswith(extension_suffixes):
                     matching_files.append(file_path)
         else:
             print(f"The provided path '{folder_path}' is not a directory.")
@@ -31,6 +46,31 @@ def list_files_by_extension_os(folder_path, file_extensions):  # -> list:
     return matching_files
 
 
+# Directory scans are I/O bound and plateau quickly beyond a few threads.
+_MAX_SCAN_WORKERS = 8
+
+
+def _scan_directory(folder_path, extension_set, recursive):
+    """
+    Scan a single directory.
+
+    Returns its matching files and (when ``recursive``) its subdirectories, in
+    directory order, as ``(is_dir, path, key)`` triples. Symlinks are
+    followed; ``key`` identifies a subdirectory's target so that symlink
+    loops can be detected, and is ``None`` for files.
+    """
+    items = []
+    with os.scandir(folder_path) as entries:
+        for entry in entries:
+            if entry.is_file():
+                if os.path.splitext(entry.name)[1].lower() in extension_set:
+                    items.append((False, entry.path, None))
+            elif recursive and entry.is_dir():
+                stat = entry.stat()
+                items.append((True, entry.path, (stat.st_dev, stat.st_ino)))
+    return items
+
+
 def list_files_by_extension(folder_path, file_extensions, recursive=False):
     """
     List all files with specified extensions in the given folder.
@@ -38,28 +78,66 @@ def list_files_by_extension(folder_path, file_extensions, recursive=False):
     folder_path (str or Path): The path to the folder where you want to search for files.
     file_extensions (list of str): A list of file extensions to search for (e.g., ['.shp', '.tif']).
     recursive (bool): Whether to recursively search through subdirectories or not.
+        Subdirectories are scanned concurrently by a small thread pool; the
+        result keeps the depth-first order of a serial walk.
     Returns:
     list: A list of file paths with the specified extensions.
     """
     matching_files = []
     try:
-        # Convert folder_path to Path object if it's a string
-        folder_path = Path(folder_path)
+        # Lowercased, dot-prefixed extensions, built once for O(1) lookups
+        extension_set = normalize_extensions(tuple(file_extensions))
 
         # Check if the provided path is a directory
-        if folder_path.is_dir():
-            for entry in folder_path.iterdir():
-                if entry.is_file() and any(
-                    entry.suffix.lower() == ext.lower() for ext in file_extensions
-                ):
-                    matching_files.append(str(entry))
-                elif recursive and entry.is_dir():
-                    # Recursively search subdirectories
-                    matching_files.extend(
-                        list_files_by_extension(entry, file_extensions, recursive)
-                    )
-        else:
+        if not os.path.isdir(folder_path):
             print(f"The provided path '{folder_path}' is not a directory.")
+            return matching_files
+
+        root = os.fspath(folder_path)
+        if not recursive:
+            return [path for _, path, _ in _scan_directory(root, extension_set, False)]
+
+        # Scan directories concurrently: each finished scan queues its
+        # subdirectories, until no scan is pending.  Symlinked directories are
+        # followed, except into one of their own ancestors (a symlink loop).
+        root_stat = os.stat(root)
+        ancestors = {root: frozenset([(root_stat.st_dev, root_stat.st_ino)])}
+        scanned = {}
+        with ThreadPoolExecutor(max_workers=_MAX_SCAN_WORKERS) as executor:
+            pending = {
+                executor.submit(_scan_directory, root, extension_set, True): root
+            }
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    directory = pending.pop(future)
+                    try:
+                        scanned[directory] = future.result()
+                    except Exception as e:
+                        # Skip unreadable subdirectories, keep the rest
+                        print(f"An error occurred: {e}")
+                        scanned[directory] = []
+                        continue
+                    for is_dir, path, key in scanned[directory]:
+                        if is_dir and key not in ancestors[directory]:
+                            ancestors[path] = ancestors[directory] | {key}
+                            sub_future = executor.submit(
+                                _scan_directory, path, extension_set, True
+                            )
+                            pending[sub_future] = path
+
+        # Rebuild the depth-first order of a serial walk
+        stack = [iter(scanned[root])]
+        while stack:
+            item = next(stack[-1], None)
+            if item is None:
+                stack.pop()
+            elif item[0]:
+                # Directories skipped as symlink loops were never scanned
+                if item[1] in scanned:
+                    stack.append(iter(scanned[item[1]]))
+            else:
+                matching_files.append(item[1])
     except Exception as e:
         print(f"An error occurred: {e}")
     return matching_files
@@ -78,25 +156,21 @@ def filter_file_os(input_files, filter_words, exclude_words=None):
         list: Filtered list of files.
     """
     # Ensure all words are lowercase for case-insensitive comparison
-    filter_words = [word.lower() for word in filter_words]
-    exclude_words = [word.lower() for word in (exclude_words or [])]
-
-    filtered_files = [
-        file
-        for file in input_files
-        if all(word in os.path.basename(file).lower() for word in filter_words)
-        and not any(
-            exclude_word in os.path.basename(file).lower()
-            for exclude_word in exclude_words
-        )
-    ]
+    filter_words = normalize_keywords(tuple(filter_words))
+    exclude_words = normalize_keywords(tuple(exclude_words or ()))
+
+    filtered_files = []
+    for file in input_files:
+        # Lowercase each basename once and reuse it for every word
+        name = os.path.basename(file).lower()
+        if all(word in name for word in filter_words) and not any(
+            exclude_word in name for exclude_word in exclude_words
+        ):
+            filtered_files.append(file)
 
     return filtered_files
 
 
-from pathlib import Path
-
-
 def filter_files(input_files, filter_words, exclude_words=None):
     """
     Filters a list of files based on include and exclude words.
@@ -110,22 +184,40 @@ def filter_files(input_files, filter_words, exclude_words=None):
         list: Filtered list of files.
     """
     # Ensure all words are lowercase for case-insensitive comparison
-    filter_words = [word.lower() for word in filter_words]
-    exclude_words = [word.lower() for word in (exclude_words or [])]
-
-    filtered_files = [
-        file
-        for file in input_files
-        if all(word in Path(file).name.lower() for word in filter_words)
-        and not any(
-            exclude_word in Path(file).name.lower() for exclude_word in exclude_words
-        )
-    ]
+    filter_words = normalize_keywords(tuple(filter_words))
+    exclude_words = normalize_keywords(tuple(exclude_words or ()))
+
+    input_files = list(input_files)
+    n_words = len(filter_words) + len(exclude_words)
+    if len(input_files) * n_words > VECTORIZE_MIN_CHECKS:
+        # Large inputs: one vectorized pass over all names per word
+        names = [Path(file).name.lower() for file in input_files]
+        mask = keyword_mask(names, filter_words, match_any=False)
+        mask &= ~keyword_mask(names, exclude_words, match_any=True)
+        return [input_files[i] for i in np.flatnonzero(mask)]
+
+    filtered_files = []
+    for file in input_files:
+        # Lowercase each basename once and reuse it for every word
+        name = Path(file).name.lower()
+        if all(word in name for word in filter_words) and not any(
+            exclude_word in name for exclude_word in exclude_words
+        ):
+            filtered_files.append(file)
 
     return filtered_files
 
 
-from pathlib import Path
+# A 4-digit year token: delimited by "_" or by the ends of the name.
+_YEAR_TOKEN_RE = re.compile(r"(?<![^_])\d{4}(?![^_])")
+
+
+def _extract_year(name: str) -> str:
+    """Return the first 4-digit year token of ``name``."""
+    match = _YEAR_TOKEN_RE.search(name)
+    if match is None:
+        raise ValueError(f"Year not found in: {name}")
+    return match.group()
 
 
 def generate_output_filename_change(i1: Path, i2: Path, change_keyword: str) -> Path:
@@ -145,18 +237,12 @@ def generate_output_filename_change(i1: Path, i2: Path, change_keyword: str) ->
     base_name_i2 = i2.stem
 
     # --- Extract years ---
-    def extract_year(name: str) -> str:
-        for part in name.split("_"):
-            if part.isdigit() and len(part) == 4:
-                return part
-        raise ValueError(f"Year not found in: {name}")
-
-    year_i1 = extract_year(base_name_i1)
-    year_i2 = extract_year(base_name_i2)
+    year_i1 = _extract_year(base_name_i1)
+    year_i2 = _extract_year(base_name_i2)
     year_start, year_end = sorted([year_i1, year_i2])
 
     # --- Remove years from the parts ---
-    parts = [p for p in base_name_i1.split("_") if not (p.isdigit() and len(p) == 4)]
+    parts = [p for p in base_name_i1.split("_") if not _YEAR_TOKEN_RE.fullmatch(p)]
 
     # --- Replace the 2nd token with the keyword ---
     if len(parts) >= 2:
@@ -170,9 +256,6 @@ def generate_output_filename_change(i1: Path, i2: Path, change_keyword: str) ->
     return i1.parent / new_base
 
 
-from pathlib import Path
-
-
 def generate_output_filename_stack(
     i1: Path, i2: Path, i3: Path, change_keyword: str
 ) -> Path:
@@ -195,18 +278,12 @@ def generate_output_filename_stack(
     base_name_i3 = i3.stem  # Gets filename without extension
 
     # Extract years (4-digit numbers)
-    def extract_year(name):
-        for part in name.split("_"):
-            if part.isdigit() and len(part) == 4:
-                return part
-        raise ValueError(f"Year not found in: {name}")
-
-    year_i1 = extract_year(base_name_i1)
-    year_i2 = extract_year(base_name_i2)
-    year_i3 = extract_year(base_name_i3)
+    year_i1 = _extract_year(base_name_i1)
+    year_i2 = _extract_year(base_name_i2)
+    year_i3 = _extract_year(base_name_i3)
 
     # Remove years from parts
-    parts = [p for p in base_name_i1.split("_") if not (p.isdigit() and len(p) == 4)]
+    parts = [p for p in base_name_i1.split("_") if not _YEAR_TOKEN_RE.fullmatch(p)]
 
     # --- Replace the 2nd token with the keyword ---
     if len(parts) >= 2:
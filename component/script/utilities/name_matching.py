@@ -0,0 +1,116 @@
+"""
+Case-insensitive name matching shared by ``file_filter`` and ``file_helpers``.
+"""
+
+import functools
+from typing import Any, FrozenSet, List, Optional, Tuple
+
+import numpy as np
+
+try:  # optional: Aho-Corasick automaton used for long keyword lists
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Below this many keywords, plain ``in`` checks are faster than an automaton.
+AUTOMATON_MIN_KEYWORDS = 4
+
+# Above this many (name, keyword) checks, the keyword filters switch to a
+# vectorized NumPy pass (see ``keyword_mask``).
+VECTORIZE_MIN_CHECKS = 10_000
+
+
+@functools.lru_cache(maxsize=256)
+def normalize_extensions(extensions: Tuple[str, ...]) -> FrozenSet[str]:
+    """Return ``extensions`` lowercased and dot-prefixed, memoized per tuple."""
+    return frozenset(
+        (ext if ext.startswith(".") else f".{ext}").lower() for ext in extensions
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def normalize_keywords(keywords: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Return ``keywords`` lowercased, memoized per tuple."""
+    return tuple(kw.lower() for kw in keywords)
+
+
+@functools.lru_cache(maxsize=64)
+def build_matcher(keywords: Tuple[str, ...]) -> Optional[Any]:
+    """
+    Build an Aho-Corasick automaton over ``keywords``.
+
+    Returns None when ``pyahocorasick`` is not installed, when there are too
+    few keywords for the automaton to pay off, or when a keyword is empty;
+    ``multi_substring_match`` then falls back to plain substring checks.
+    """
+    if (
+        ahocorasick is None
+        or len(keywords) < AUTOMATON_MIN_KEYWORDS
+        or not all(keywords)
+    ):
+        return None
+    automaton = ahocorasick.Automaton()
+    for index, keyword in enumerate(dict.fromkeys(keywords)):
+        automaton.add_word(keyword, index)
+    automaton.make_automaton()
+    return automaton
+
+
+def multi_substring_match(
+    name: str, keywords: Tuple[str, ...], matcher: Optional[Any], match_any: bool
+) -> bool:
+    """
+    Return True if any (``match_any``) or all of ``keywords`` occur in ``name``.
+
+    With a ``matcher`` from ``build_matcher``, all keywords are searched in a
+    single pass over ``name`` instead of one scan per keyword.
+    """
+    if len(keywords) == 1:
+        # "any" and "all" coincide for a single keyword
+        return keywords[0] in name
+
+    if matcher is None:
+        # Plain loops rather than any()/all(): no generator per name
+        if match_any:
+            for keyword in keywords:
+                if keyword in name:
+                    return True
+            return False
+        for keyword in keywords:
+            if keyword not in name:
+                return False
+        return True
+
+    if match_any:
+        for _ in matcher.iter(name):
+            return True
+        return False
+
+    # Tally the distinct keywords seen as bits until every one is present
+    all_seen = (1 << len(matcher)) - 1
+    seen = 0
+    for _, index in matcher.iter(name):
+        seen |= 1 << index
+        if seen == all_seen:
+            return True
+    return False
+
+
+def keyword_mask(
+    names: List[str], keywords: Tuple[str, ...], match_any: bool
+) -> np.ndarray:
+    """
+    Vectorized ``multi_substring_match`` over a list of lowercased names.
+
+    Each keyword is searched in all names at once with ``np.char.find``, so
+    the Python-level loop runs over the keywords only.
+    """
+    names = np.asarray(names, dtype=str)
+    mask = np.full(names.shape, not match_any)
+    for keyword in keywords:
+        hit = np.char.find(names, keyword) >= 0
+        if match_any:
+            mask |= hit
+        else:
+            mask &= hit
+    return mask
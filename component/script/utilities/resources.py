@@ -1,6 +1,7 @@
 import os
 import uuid
 import psutil
+import numba
 import numpy as np
 import pandas as pd
 from osgeo import gdal
@@ -10,28 +11,62 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 # ================================================================
 # Helpers
 # ================================================================
+# GDAL data type -> size of one pixel in bytes, filled on first use.
+_BYTES_PER_PIXEL = {}
+
+
 def estimate_raster_size(path):
     """Return (ny, nx, nband, est_bytes, est_gb) for a raster."""
     r = gdal.Open(path)
-    ny, nx = r.RasterYSize, r.RasterXSize
-    nband = r.RasterCount
+    try:
+        ny, nx = r.RasterYSize, r.RasterXSize
+        nband = r.RasterCount
+        data_type = r.GetRasterBand(1).DataType
+    finally:
+        # Close the dataset now rather than whenever it is garbage collected
+        r = None
 
     # Get actual pixel size in bytes using GDAL's data type info
-    band = r.GetRasterBand(1)
-    bytes_per_pixel = gdal.GetDataTypeSizeInBytes(band.DataType)
+    bytes_per_pixel = _BYTES_PER_PIXEL.get(data_type)
+    if bytes_per_pixel is None:
+        bytes_per_pixel = gdal.GetDataTypeSizeInBytes(data_type)
+        _BYTES_PER_PIXEL[data_type] = bytes_per_pixel
 
     est_bytes = ny * nx * nband * bytes_per_pixel  # Dynamically calculated
     est_gb = est_bytes / (1024**3)
     return ny, nx, nband, est_bytes, est_gb
 
 
+def estimate_raster_batch(paths, max_workers=8):
+    """
+    Run ``estimate_raster_size`` on many rasters using a thread pool.
+
+    GDAL releases the GIL while opening files, so the opens overlap.
+    Returns a dict {path: (ny, nx, nband, est_bytes, est_gb)} in the order of
+    ``paths``.
+    """
+    paths = list(paths)
+    results = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(estimate_raster_size, p): p for p in paths}
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+    return {p: results[p] for p in paths}
+
+
+# Compiled eagerly (explicit signature) and cached on disk, so the first call
+# does not pay for type inference.
+@numba.njit("i8(i8, i8, i8, f8, f8)", cache=True)
+def _optimal_block_rows(ny, nx, nband, ram_gb, ram_fraction):
+    target_bytes = np.int64(ram_gb * ram_fraction * 1024**3)
+    bytes_per_row = nx * nband * 4  # float32
+    max_rows = target_bytes // bytes_per_row
+    return max(1, min(ny, max_rows))
+
+
 def optimal_block_shape(ny, nx, nband, ram_gb, ram_fraction=0.7):
     """
     Estimate optimal block height for sequential reading given available RAM.
     Returns (blk_rows, blk_cols).
     """
-    target_gb = ram_gb * ram_fraction
-    bytes_per_row = nx * nband * 4  # float32
-    max_rows = int((target_gb * 1024**3) / bytes_per_row)
-    max_rows = max(1, min(ny, max_rows))
-    return max_rows, nx
+    return int(_optimal_block_rows(ny, nx, nband, ram_gb, ram_fraction)), nx
@@ -12,9 +12,8 @@ The wrapper follows the same style as ``export_raster_with_dask``:
   * If the output file already exists and `overwrite=False`, a warning
     is logged and a dummy future is returned.
 
-The function returns a :class:`dask.distributed.Future` that resolves
-to ``None`` the caller can use it for side effects or to chain
-further tasks.
+The function waits for the task, so the distance raster is on disk when it
+returns; the finished future is returned so the caller can still inspect it.
 """
 
 # ------------------------------------------------------------------
@@ -23,11 +22,25 @@ further tasks.
 from __future__ import annotations
 
 import logging
-from pathlib import Path
+from concurrent.futures import Future as ConcurrentFuture
 from typing import Any, Optional
 
 import dask
 from dask.distributed import Client, Future, Lock, get_client
+from osgeo import gdal
+
+from component.script.utilities.dask_helpers import complete_on_disk, completed_future
+
+# Creation options of the output distance raster.  PREDICTOR=3 (floating
+# point) compresses the smooth Float32 distances much better under LZW, and
+# NUM_THREADS lets GDAL compress tiles on all cores.
+_OUTPUT_OPTIONS = [
+    "COMPRESS=LZW",
+    "PREDICTOR=3",
+    "NUM_THREADS=ALL_CPUS",
+    "TILED=YES",
+    "BIGTIFF=YES",
+]
 
 
 # ------------------------------------------------------------------
@@ -41,23 +54,26 @@ def raster_proximity_with_dask(
     nodata: int = 0,
     overwrite: bool = False,
     **kwargs: Any,  # forwarded to the worker (unused but kept for API parity)
-) -> Future:
+) -> Future | ConcurrentFuture:
     """
-    Reproject a raster using rioxarray/odc.geo on a Dask worker.
+    Compute the distance to the target pixels of a raster on a Dask worker.
+
+    The call blocks until the distance raster is written, so callers may read
+    ``output_file`` as soon as it returns.
 
     Parameters
     ----------
     input_file : str
         Path to the source raster (must be accessible from each worker).
     output_file : str
-        Destination path for the reprojected raster.
-    target_epsg : int | str
-        Target EPSG code (e.g. ``4326`` or ``"EPSG:4326"``).
-    resolution : float
-        Output pixel size in target units (default 30 m).
-    resampling_method : str
-        Resampling algorithm accepted by ``xr_reproject`` (`nearest`,
-        `bilinear`, etc.).
+        Destination path for the Float32 distance raster.
+    target_values : list, optional
+        Pixel values distances are measured to (default ``[0]``). If empty,
+        every non-zero pixel is a target.
+    distance_metric : str, optional
+        Only ``"EUCLIDEAN"`` is supported; other values raise ``ValueError``.
+    nodata : int, optional
+        Currently ignored: the output raster has no no-data value.
     overwrite : bool, optional
         Skip the task if ``output_file`` exists and this is False.
     **kwargs
@@ -66,32 +82,42 @@ def raster_proximity_with_dask(
 
     Returns
     -------
-    dask.distributed.Future
-        Future that resolves to ``None`` once reprojection has finished.
+    dask.distributed.Future | concurrent.futures.Future
+        The finished task, resolved to ``None``. When the task is skipped
+        because the file exists, an already-resolved
+        ``concurrent.futures.Future`` is returned instead.
     """
     # 1. Skip if output already exists
-    if not overwrite and Path(output_file).exists():
+    if not overwrite and complete_on_disk(output_file):
         logging.warning(
             f"File {output_file} already exists and overwrite=False – "
-            "skipping rioxarray warp."
+            "skipping proximity computation."
         )
-        # Use get_client() to get the current client if none provided
-        current_client = get_client()
-        return current_client.submit(lambda: None)
-
-    # 2. Submit the worker function to a Dask worker
-    return _distance_dask(
+        # Already resolved locally: no scheduler round-trip for a no-op task
+        return completed_future()
+
+    # 2. Submit the worker function to a Dask worker.  pure=False: the task
+    #    writes a file, so identical calls must not be deduplicated.
+    client = get_client()
+    future = client.submit(
+        _distance_dask,
         input_file,
         output_file,
         target_values,
         distance_metric,
         nodata,
+        pure=False,
         **kwargs,
     )
+    # 3. Wait for the raster: callers run this in a loop, drop the return
+    #    value and read the outputs right after, so an unreferenced future
+    #    would be cancelled or finish too late.
+    future.result()
+    return future
 
 
 # ------------------------------------------------------------------
-# Helper that actually performs the reprojection on a worker
+# Helper that actually computes the distance on a worker
 # ------------------------------------------------------------------
 def _distance_dask(
     input_file: str = None,
@@ -100,45 +126,49 @@ def _distance_dask(
     distance_metric: str = "EUCLIDEAN",
     nodata=0,
 ) -> None:
-    import xrspatial
-    import rioxarray
+    # GDAL's proximity kernel only measures straight-line distances.
+    if distance_metric.upper() != "EUCLIDEAN":
+        raise ValueError(
+            "Only distance_metric='EUCLIDEAN' is supported, "
+            f"got {distance_metric!r}."
+        )
 
     # ------------------------------------------------------------------
-    # 1. Load the raster on the worker
+    # 1. Open the raster on the worker
     # ------------------------------------------------------------------
-    raster = rioxarray.open_rasterio(
-        input_file,
-        chunks="auto",  # let XArray/Dask decide optimal chunking
-        cache=False,  # avoid keeping an in‑memory copy of the raw dataset
-        lock=False,  # we will handle write locking explicitly below
-    )
+    src_ds = gdal.Open(str(input_file))
+    if src_ds is None:
+        raise FileNotFoundError(f"Cannot open raster: {input_file}")
+    src_band = src_ds.GetRasterBand(1)
 
-    # ------------------------------------------------------------------
-    # 2. Calculte distance with xrspatial
-    # ------------------------------------------------------------------
-    distance = xrspatial.proximity(
-        raster=raster.isel(band=0),
-        target_values=target_values,
-        distance_metric=distance_metric,
-    )
+    # Distances in georeferenced units, as xrspatial did from the x/y coords.
+    # Without VALUES, every non-zero pixel is a target.
+    options = ["DISTUNITS=GEO"]
+    if target_values:
+        options.append("VALUES=" + ",".join(str(v) for v in target_values))
 
-    # da_rasterized = xr.wrap_xr(im=im, gbox=geobox)
     # ------------------------------------------------------------------
-    # 3. Write out the result – use a Dask lock to avoid concurrent writes.
+    # 2-3. Create the output and stream the distance into it with GDAL's
+    #      C++ proximity kernel – use a Dask lock to avoid concurrent writes.
+    #      The lock is per output file, so different rasters run in parallel.
     # ------------------------------------------------------------------
-    # Grab the local client so that we can create a distributed Lock
-    from dask.distributed import Lock
+    with Lock(str(output_file)):
+        dst_ds = gdal.GetDriverByName("GTiff").Create(
+            str(output_file),
+            src_ds.RasterXSize,
+            src_ds.RasterYSize,
+            1,
+            gdal.GDT_Float32,
+            options=_OUTPUT_OPTIONS,
+        )
+        if dst_ds is None:
+            raise RuntimeError(f"Cannot create raster: {output_file}")
+        dst_ds.SetGeoTransform(src_ds.GetGeoTransform())
+        dst_ds.SetProjection(src_ds.GetProjection())
 
-    distance.rio.to_raster(
-        output_file,
-        driver="GTiff",
-        compress="LZW",
-        # predictor=2,
-        bigtiff="YES",
-        tiled=True,
-        lock=Lock("rio"),
-    )
+        gdal.ComputeProximity(src_band, dst_ds.GetRasterBand(1), options=options)
 
-    # Explicitly close references – not strictly required but tidy.
-    del raster
-    del distance
+        # Closing the datasets flushes the output to disk.
+        dst_ds = None
+    src_band = None
+    src_ds = None
@@ -23,11 +23,12 @@ further tasks.
 from __future__ import annotations
 
 import logging
-from pathlib import Path
 from typing import Any, Optional
 
 import dask
-from dask.distributed import Client, Future, Lock, get_client
+from dask.distributed import Client, Future, Lock
+
+from component.script.utilities.dask_helpers import complete_on_disk, completed_future
 
 
 # ------------------------------------------------------------------
@@ -70,14 +71,13 @@ def reproject_raster_rio_with_dask(
         Future that resolves to ``None`` once reprojection has finished.
     """
     # 1. Skip if output already exists
-    if not overwrite and Path(output_file).exists():
+    if not overwrite and complete_on_disk(output_file):
         logging.warning(
             f"File {output_file} already exists and overwrite=False – "
             "skipping rioxarray warp."
         )
-        # Use get_client() to get the current client if none provided
-        current_client = get_client()
-        return current_client.submit(lambda: None)
+        # Already resolved locally: no scheduler round-trip for a no-op task
+        return completed_future()
 
     # 2. Submit the worker function to a Dask worker
     return _reproject_raster_worker(